@@ -6,12 +6,32 @@ A smart directory tree generator with configurable ignore patterns and user pref
 
 import os
 import sys
-import subprocess
 import datetime
+import time
 import json
 import hashlib
+import bisect
+import fnmatch
+import functools
+import re
+import queue
+import threading
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, Iterator, List, Pattern, Set, Tuple, Optional
+
+try:
+    import colorama
+    import questionary
+    from colorama import Fore, Style
+except ImportError:
+    sys.exit("FSP Directory Mapper requires colorama and questionary: pip install colorama questionary")
+
+# Optional: faster JSON encoding for the configuration file
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configuration file name
 CONFIG_FILE = ".fsp_directory_mapper_config.json"
@@ -76,31 +96,256 @@ COMMON_IGNORE_PATTERNS = {
 # Threshold for "large" directories
 LARGE_DIR_THRESHOLD = 100  # Number of items
 
-def check_and_install_dependencies():
-    """Check if required packages are installed, and install them if needed."""
-    required_packages = {
-        'colorama': 'For colored terminal output',
-        'questionary': 'For interactive prompts'
-    }
+def _dump_config(config: Dict) -> bytes:
+    """Serialize the configuration as indented JSON."""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode('utf-8')
+
+# Per-file modification times are formatted without building datetime objects
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+_localtime = time.localtime
+_strftime = time.strftime
+
+def _default_scan_workers() -> int:
+    """Worker threads for scanning, overridable with FSP_SCAN_WORKERS (0 = none)."""
+    try:
+        return max(0, int(os.environ['FSP_SCAN_WORKERS']))
+    except (KeyError, ValueError):
+        return min(32, (os.cpu_count() or 1) * 4)
+
+# Threads that read directories while scanning. Reads release the GIL, so their
+# latency overlaps, which pays off on a cold cache or a network filesystem; on
+# a warm local cache the queue handoffs make a scan slightly slower instead.
+SCAN_WORKERS = _default_scan_workers()
+
+# File icons by extension
+_ICON_MAPPING = {
+    '.py': '🐍',    # Python
+    '.js': '📜',    # JavaScript
+    '.html': '🌐',  # HTML
+    '.css': '🎨',   # CSS
+    '.json': '📋',  # JSON
+    '.md': '📝',    # Markdown
+    '.txt': '📄',   # Text
+    '.pdf': '📑',   # PDF
+    '.jpg': '🖼️',   # Image
+    '.jpeg': '🖼️',  # Image
+    '.png': '🖼️',   # Image
+    '.gif': '🖼️',   # Image
+    '.svg': '🖼️',   # Image
+    '.mp3': '🎵',   # Audio
+    '.mp4': '🎬',   # Video
+    '.zip': '📦',   # Archive
+    '.tar': '📦',   # Archive
+    '.gz': '📦',    # Archive
+    '.rar': '📦',   # Archive
+    '.7z': '📦',    # Archive
+    '.doc': '📃',   # Document
+    '.docx': '📃',  # Document
+    '.xls': '📊',   # Spreadsheet
+    '.xlsx': '📊',  # Spreadsheet
+    '.ppt': '📽️',   # Presentation
+    '.pptx': '📽️',  # Presentation
+    '.sh': '⚙️',    # Shell script
+    '.bat': '⚙️',   # Batch script
+    '.exe': '⚙️',   # Executable
+    '.dll': '🔌',   # Library
+    '.so': '🔌',    # Library
+    '.h': '📚',     # Header
+    '.c': '📚',     # C source
+    '.cpp': '📚',   # C++ source
+    '.java': '☕',  # Java
+    '.class': '☕', # Java class
+    '.rb': '💎',    # Ruby
+    '.php': '🐘',   # PHP
+    '.sql': '🗄️',   # SQL
+    '.db': '🗄️',    # Database
+    '.xml': '📰',   # XML
+    '.yml': '📰',   # YAML
+    '.yaml': '📰',  # YAML
+    '.toml': '📰',  # TOML
+    '.ini': '⚙️',   # INI configuration
+    '.cfg': '⚙️',   # Configuration
+    '.conf': '⚙️',  # Configuration
+    '.log': '📜',   # Log
+}
+
+# Extensions grouped by icon, for the legend
+_ICON_GROUPS = {}
+for _ext, _icon in _ICON_MAPPING.items():
+    _ICON_GROUPS.setdefault(_icon, []).append(_ext)
+
+def _build_legend(icon_groups: Dict[str, List[str]]) -> str:
+    """Render the markdown icon legend section."""
+    lines = ["## Icon Legend\n\n", "📁 - Directory\n"]
     
-    for package, description in required_packages.items():
-        try:
-            __import__(package)
-        except ImportError:
-            print(f"Installing required package: {package} ({description})")
+    # Group icons by type
+    for icon, extensions in sorted(icon_groups.items()):
+        exts = sorted(extensions)
+        if len(exts) > 5:
+            ext_display = ", ".join(exts[:5]) + ", etc."
+        else:
+            ext_display = ", ".join(exts)
+        lines.append(f"{icon} - {ext_display}\n")
+    return "".join(lines)
+
+# The legend only depends on the constants above
+_ICON_LEGEND = _build_legend(_ICON_GROUPS)
+
+def _compile_file_patterns(patterns) -> Tuple[Tuple[str, ...], Optional[Pattern]]:
+    """Split wildcard file patterns into plain suffixes and one regex for the rest."""
+    extensions = []
+    complex_patterns = []
+    for pattern in patterns:
+        pattern = os.path.normcase(pattern)
+        suffix = pattern[1:]
+        if pattern.startswith('*.') and not any(c in suffix for c in '*?['):
+            extensions.append(suffix)
+        else:
+            complex_patterns.append(pattern)
+    
+    regex = None
+    if complex_patterns:
+        regex = re.compile('|'.join(fnmatch.translate(p) for p in complex_patterns))
+    return tuple(extensions), regex
+
+def _matches_file_patterns(name: str, extensions: Tuple[str, ...], regex: Optional[Pattern]) -> bool:
+    """Check a file name against patterns compiled by _compile_file_patterns."""
+    name = os.path.normcase(name)
+    return name.endswith(extensions) or (regex is not None and regex.match(name) is not None)
+
+# Wildcard entries of COMMON_IGNORE_PATTERNS, compiled once for detection
+_COMMON_FILE_WILDCARDS = [p for p in COMMON_IGNORE_PATTERNS['files'] if '*' in p]
+_COMMON_FILE_EXTENSIONS, _COMMON_FILE_REGEX = _compile_file_patterns(_COMMON_FILE_WILDCARDS)
+
+def _scan(path: str) -> Iterator[Tuple[os.DirEntry, bool]]:
+    """Yield (entry, is_dir) for each item directly inside a directory.
+    
+    Like os.walk, a symlink to a directory counts as a directory; callers
+    should not descend into it (entry.is_symlink()).
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
             try:
-                subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-                print(f"Successfully installed {package}")
-            except subprocess.CalledProcessError:
-                print(f"Failed to install {package}. Please install it manually with: pip install {package}")
-                sys.exit(1)
-    
-    # Import after ensuring they're installed
-    global colorama, questionary, Fore, Style
-    import colorama
-    import questionary
-    from colorama import Fore, Style
-    colorama.init()
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            yield entry, is_dir
+
+# Whether directories can be listed through a file descriptor (POSIX)
+_SCANDIR_BY_FD = os.scandir in os.supports_fd and hasattr(os, 'O_DIRECTORY')
+
+def _read_directory(path: str) -> Tuple[List[Tuple[str, str, bool]], List[Tuple[str, Optional[os.stat_result]]]]:
+    """List a directory sorted by name as (name, path, is_link) dirs and (name, stat) files.
+    
+    Runs on the scan worker threads; an unreadable directory lists as empty.
+    Where supported the directory is listed through an open descriptor, so each
+    file's stat is resolved relative to it (fstatat) instead of by full path.
+    """
+    dirs = []
+    files = []
+    dir_fd = None
+    try:
+        if _SCANDIR_BY_FD:
+            dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+            with os.scandir(dir_fd) as it:
+                entries = sorted(it, key=attrgetter('name'))
+        else:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=attrgetter('name'))
+    except OSError:
+        entries = []
+    
+    try:
+        # One sorted list, split in a single pass, keeps both halves sorted
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                # Entries listed by descriptor only carry their name
+                dirs.append((entry.name, os.path.join(path, entry.name), entry.is_symlink()))
+                continue
+            try:
+                file_stats = entry.stat()
+            except OSError:
+                file_stats = None
+            files.append((entry.name, file_stats))
+    finally:
+        # Only close once the stats, which still need the descriptor, are done
+        if dir_fd is not None:
+            os.close(dir_fd)
+    return dirs, files
+
+def _walk_listings(path: str, relative_path: str) -> Iterator[Tuple[str, list, list]]:
+    """Read a tree depth-first, yielding (relative path, dirs, files) listings.
+    
+    Common ignore directories and symlinked directories are listed but not
+    descended into.
+    """
+    common_dirs = COMMON_IGNORE_PATTERNS['directories']
+    pending = [(path, relative_path)]
+    while pending:
+        path, relative_path = pending.pop()
+        dirs, files = _read_directory(path)
+        for name, dir_path, is_link in dirs:
+            if not is_link and name not in common_dirs:
+                pending.append((dir_path, relative_path + '/' + name if relative_path else name))
+        yield relative_path, dirs, files
+
+def _walk_listings_parallel(path: str, relative_path: str) -> Iterator[Tuple[str, list, list]]:
+    """Like _walk_listings, but with directories read on SCAN_WORKERS threads.
+    
+    Long-lived workers take directories from one queue and put their listings
+    on another. The calling thread queues each subdirectory it receives, so
+    listings arrive in no particular order. Once the caller stops, by an
+    interrupt or otherwise, queued directories are dropped and the workers exit.
+    """
+    common_dirs = COMMON_IGNORE_PATTERNS['directories']
+    tasks = queue.Queue()
+    results = queue.Queue()
+    
+    def work():
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            try:
+                results.put((task[1],) + _read_directory(task[0]))
+            except BaseException as e:
+                # Hand the failure to the caller rather than leave it waiting
+                results.put(e)
+    
+    workers = [threading.Thread(target=work, daemon=True) for _ in range(SCAN_WORKERS)]
+    for worker in workers:
+        worker.start()
+    
+    try:
+        tasks.put((path, relative_path))
+        outstanding = 1
+        while outstanding:
+            listing = results.get()
+            outstanding -= 1
+            if isinstance(listing, BaseException):
+                raise listing
+            
+            # Queue the subdirectories before handing the listing over
+            relative_path, dirs, _ = listing
+            for name, dir_path, is_link in dirs:
+                if not is_link and name not in common_dirs:
+                    tasks.put((dir_path, relative_path + '/' + name if relative_path else name))
+                    outstanding += 1
+            yield listing
+    finally:
+        while True:
+            try:
+                tasks.get_nowait()
+            except queue.Empty:
+                break
+        for _ in workers:
+            tasks.put(None)
 
 class DirectoryMapperConfig:
     """Manages configuration and user preferences."""
@@ -110,15 +355,27 @@ class DirectoryMapperConfig:
         self.config = self.load_config()
         self.session_choices = {}
         self.new_patterns_found = set()
+        
+        # Answers only change when the patterns do; _compile_patterns clears it
+        @functools.lru_cache(maxsize=4096)
+        def cached_should_ignore(name: str, is_dir: bool) -> Optional[bool]:
+            return self._match_ignore(name, is_dir)
+        self._should_ignore_cached = cached_should_ignore
+        self._compile_patterns()
     
     def load_config(self) -> Dict:
         """Load configuration from file if it exists."""
         if os.path.exists(self.config_file):
             try:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    config = json.load(f)
+                self._dirty = False
+                return config
             except (json.JSONDecodeError, IOError):
                 print(f"{Fore.YELLOW}Warning: Could not load config file. Starting fresh.{Style.RESET_ALL}")
+        
+        # A fresh configuration has never been written
+        self._dirty = True
         return {
             'version': '1.0',
             'created': datetime.datetime.now().isoformat(),
@@ -131,29 +388,63 @@ class DirectoryMapperConfig:
         }
     
     def save_config(self):
-        """Save configuration to file."""
+        """Save configuration to file, skipping the write if nothing changed."""
+        if not self._dirty:
+            print(f"{Fore.GREEN}Configuration in {self.config_file} is already up to date{Style.RESET_ALL}")
+            return
+        
         self.config['last_updated'] = datetime.datetime.now().isoformat()
+        temp_file = self.config_file + '.tmp'
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2)
+            # Write a temporary file and swap it in, so a failed write
+            # never leaves a half-written configuration behind
+            with open(temp_file, 'wb') as f:
+                f.write(_dump_config(self.config))
+            os.replace(temp_file, self.config_file)
+            self._dirty = False
             print(f"{Fore.GREEN}Configuration saved to {self.config_file}{Style.RESET_ALL}")
         except IOError as e:
             print(f"{Fore.RED}Error saving configuration: {e}{Style.RESET_ALL}")
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+    
+    def _compile_patterns(self):
+        """Precompile the wildcard file patterns that are marked as ignored."""
+        wildcards = [
+            pattern for pattern, ignore in self.config['ignore_patterns']['files'].items()
+            if '*' in pattern and ignore
+        ]
+        self._ext_file_ignores, self._complex_re = _compile_file_patterns(wildcards)
+        self._should_ignore_cached.cache_clear()
+    
+    def set_ignore_pattern(self, category: str, name: str, ignore: bool):
+        """Record whether a directory or file pattern should be ignored."""
+        patterns = self.config['ignore_patterns'][category]
+        if name in patterns and patterns[name] == ignore:
+            return
+        patterns[name] = ignore
+        self._dirty = True
+        self._compile_patterns()
     
     def get_project_hash(self, base_path: str) -> str:
         """Generate a hash of the project structure for change detection."""
-        hasher = hashlib.md5()
-        
-        # Get a sorted list of all directories and files
-        all_items = []
-        for root, dirs, files in os.walk(base_path):
-            for d in sorted(dirs):
-                all_items.append(os.path.relpath(os.path.join(root, d), base_path))
-            for f in sorted(files):
-                all_items.append(os.path.relpath(os.path.join(root, f), base_path))
-        
-        # Hash the structure
-        hasher.update(''.join(sorted(all_items)).encode())
+        hasher = hashlib.blake2b(digest_size=16)
+        
+        # Feed every relative path in sorted depth-first order
+        def collect(path: str, relative_path: str):
+            try:
+                entries = sorted(_scan(path), key=lambda item: item[0].name)
+            except OSError:
+                return
+            for entry, is_dir in entries:
+                item_path = relative_path + '/' + entry.name if relative_path else entry.name
+                # NUL-separated so that adjacent paths cannot run together
+                hasher.update(item_path.encode('utf-8', 'surrogateescape'))
+                hasher.update(b'\0')
+                if is_dir and not entry.is_symlink():
+                    collect(entry.path, item_path)
+        
+        collect(base_path, '')
         return hasher.hexdigest()
     
     def has_project_changed(self, base_path: str) -> bool:
@@ -161,11 +452,16 @@ class DirectoryMapperConfig:
         current_hash = self.get_project_hash(base_path)
         if self.config.get('project_hash') != current_hash:
             self.config['project_hash'] = current_hash
+            self._dirty = True
             return True
         return False
     
     def should_ignore(self, name: str, is_dir: bool) -> Optional[bool]:
         """Check if an item should be ignored based on saved preferences."""
+        return self._should_ignore_cached(name, is_dir)
+    
+    def _match_ignore(self, name: str, is_dir: bool) -> Optional[bool]:
+        """Uncached lookup behind should_ignore."""
         category = 'directories' if is_dir else 'files'
         
         # Check exact matches
@@ -173,15 +469,36 @@ class DirectoryMapperConfig:
             return self.config['ignore_patterns'][category][name]
         
         # Check pattern matches for files
-        if not is_dir:
-            for pattern, should_ignore in self.config['ignore_patterns']['files'].items():
-                if '*' in pattern:
-                    import fnmatch
-                    if fnmatch.fnmatch(name, pattern):
-                        return should_ignore
+        if not is_dir and _matches_file_patterns(name, self._ext_file_ignores, self._complex_re):
+            return True
         
         return None
 
+class TreeScanResult:
+    """Everything collected from a single traversal of the project tree.
+    
+    Relative paths are '/'-separated on every platform.
+    """
+    
+    def __init__(self):
+        # Relative directory path -> sorted child directory names and (file name,
+        # stat result) pairs; the stat result is None if the file could not be read
+        self.structure: Dict[str, Dict[str, list]] = {}
+        # Relative directory path -> total number of items beneath it
+        self.item_counts: Dict[str, int] = {}
+        # Relative path -> absolute path of common ignore directories not descended into
+        self.pruned: Dict[str, str] = {}
+        # Relative directory path -> pruned directories anywhere beneath it
+        self.pruned_below: Dict[str, List[str]] = {}
+        # Relative path -> absolute path of symlinked directories, never descended into
+        self.links: Dict[str, str] = {}
+        # Common ignore directory name -> absolute path of its first occurrence
+        self.example_paths: Dict[str, str] = {}
+        self.detected: Dict[str, Set[str]] = {
+            'directories': set(),
+            'files': set()
+        }
+
 class DirectoryMapper:
     """Main directory mapping functionality."""
     
@@ -194,47 +511,202 @@ class DirectoryMapper:
             'directories': set(),
             'files': set()
         }
+        
+        # Cleared whenever the ignore preferences are (re)decided
+        @functools.lru_cache(maxsize=4096)
+        def cached_should_ignore_item(name: str, is_dir: bool) -> bool:
+            return self._match_ignore_item(name, is_dir)
+        self._should_ignore_item_cached = cached_should_ignore_item
     
-    def count_directory_contents(self, path: str) -> int:
-        """Count the number of items in a directory."""
+    def count_directory_contents(self, path: str, limit: Optional[int] = None) -> int:
+        """Count the number of items in a directory.
+        
+        With a limit, counting stops as soon as the count exceeds it and that
+        partial count is returned; only complete counts are cached.
+        """
         if path in self.large_dirs_cache:
             return self.large_dirs_cache[path]
         
         count = 0
-        try:
-            for _, dirs, files in os.walk(path):
-                count += len(dirs) + len(files)
-        except (PermissionError, OSError):
-            count = 0
+        pending = [path]
+        while pending:
+            try:
+                for entry, is_dir in _scan(pending.pop()):
+                    count += 1
+                    if limit is not None and count > limit:
+                        return count
+                    if is_dir and not entry.is_symlink():
+                        pending.append(entry.path)
+            except OSError:
+                pass
         
         self.large_dirs_cache[path] = count
         return count
     
     def is_large_directory(self, path: str) -> bool:
         """Check if a directory contains many files."""
-        return self.count_directory_contents(path) > LARGE_DIR_THRESHOLD
+        return self.count_directory_contents(path, limit=LARGE_DIR_THRESHOLD) > LARGE_DIR_THRESHOLD
+    
+    def scan_tree(self, base_path: str) -> TreeScanResult:
+        """Walk the project once, collecting structure and detected patterns."""
+        result = TreeScanResult()
+        self._scan_into(result, base_path, '')
+        return result
+    
+    def ensure_scanned(self, scan: TreeScanResult, relative_path: str):
+        """Scan a directory pruned by scan_tree once it turns out to be included."""
+        path = scan.pruned.pop(relative_path, None)
+        if path is None:
+            return
+        
+        count = self._scan_into(scan, path, relative_path)
+        nested = scan.pruned_below.get(relative_path, [])
+        
+        # Fold the newly found items into every ancestor's total
+        parent = relative_path
+        while parent:
+            parent = parent.rpartition('/')[0]
+            scan.item_counts[parent] += count
+            scan.pruned_below.setdefault(parent, []).extend(nested)
+    
+    def expand_included_dirs(self, scan: TreeScanResult):
+        """Scan the pruned directories the user has chosen to include."""
+        decided = self.config.config['ignore_patterns']['directories']
+        
+        # Included directories may themselves hold further pruned ones
+        expanded = True
+        while expanded:
+            expanded = False
+            for relative_path in list(scan.pruned):
+                parts = relative_path.split('/')
+                if decided.get(parts[-1]) is not False:
+                    continue
+                if any(self.should_ignore_item(part, True) for part in parts[:-1]):
+                    continue
+                self.ensure_scanned(scan, relative_path)
+                expanded = True
+    
+    def full_item_count(self, scan: TreeScanResult, relative_path: str) -> int:
+        """Count every item beneath a scanned directory, ignored ones included."""
+        count = scan.item_counts.get(relative_path, 0)
+        for pruned_path in scan.pruned_below.get(relative_path, ()):
+            # Directories expanded since have been folded into item_counts
+            if pruned_path in scan.pruned:
+                count += self.count_directory_contents(scan.pruned[pruned_path])
+        return count
     
-    def detect_ignore_patterns(self, base_path: str):
-        """Detect which ignore patterns are present in the project."""
-        for root, dirs, files in os.walk(base_path):
+    def _scan_into(self, result: TreeScanResult, base_path: str, base_relative_path: str) -> int:
+        """Scan base_path into result, returning the number of items found.
+        
+        With SCAN_WORKERS set, directories are read on worker threads; this
+        thread merges each listing, so result is only ever touched from here.
+        """
+        # Bind everything the per-entry loop touches to locals
+        structure = result.structure
+        detected_dirs = result.detected['directories']
+        detected_files = result.detected['files']
+        common_dirs = COMMON_IGNORE_PATTERNS['directories']
+        common_files = COMMON_IGNORE_PATTERNS['files']
+        matches_file_patterns = _matches_file_patterns
+        _fnmatch = fnmatch.fnmatch
+        pruned = result.pruned
+        links = result.links
+        
+        if SCAN_WORKERS > 0:
+            listings = _walk_listings_parallel(base_path, base_relative_path)
+        else:
+            listings = _walk_listings(base_path, base_relative_path)
+        
+        for relative_path, dirs, files in listings:
             # Check directories
-            for d in dirs:
-                if d in COMMON_IGNORE_PATTERNS['directories']:
-                    self.detected_patterns['directories'].add(d)
+            for name, path, is_link in dirs:
+                item_path = relative_path + '/' + name if relative_path else name
+                if name in common_dirs:
+                    detected_dirs.add(name)
+                if is_link:
+                    # Listed like os.walk does, but never followed
+                    links[item_path] = path
+                elif name in common_dirs:
+                    # Record the hit but leave descending for later, if ever
+                    pruned[item_path] = path
             
             # Check files
-            for f in files:
+            for name, _ in files:
                 # Exact matches
-                if f in COMMON_IGNORE_PATTERNS['files']:
-                    self.detected_patterns['files'].add(f)
-                # Pattern matches
-                for pattern in COMMON_IGNORE_PATTERNS['files']:
-                    if '*' in pattern:
-                        import fnmatch
-                        if fnmatch.fnmatch(f, pattern):
-                            self.detected_patterns['files'].add(pattern)
-    
-    def ask_user_preferences(self, base_path: str):
+                if name in common_files:
+                    detected_files.add(name)
+                # Pattern matches; only a hit needs to know which pattern matched
+                if matches_file_patterns(name, _COMMON_FILE_EXTENSIONS, _COMMON_FILE_REGEX):
+                    detected_files.update(
+                        pattern for pattern in _COMMON_FILE_WILDCARDS
+                        if _fnmatch(name, pattern)
+                    )
+            
+            structure[relative_path] = {
+                'dirs': [name for name, _, _ in dirs],
+                'files': files
+            }
+        
+        # Listings arrive in any order, so derive everything order-sensitive
+        # from a depth-first pass over the sorted structure
+        example_paths = result.example_paths
+        item_counts = result.item_counts
+        pruned_below = result.pruned_below
+        
+        def finish(relative_path: str) -> int:
+            data = structure[relative_path]
+            count = len(data['dirs']) + len(data['files'])
+            below = []
+            for name in data['dirs']:
+                item_path = relative_path + '/' + name if relative_path else name
+                if item_path in pruned:
+                    example_paths.setdefault(name, pruned[item_path])
+                    below.append(item_path)
+                elif item_path in links:
+                    if name in COMMON_IGNORE_PATTERNS['directories']:
+                        example_paths.setdefault(name, links[item_path])
+                else:
+                    count += finish(item_path)
+                    below.extend(pruned_below.get(item_path, ()))
+            
+            item_counts[relative_path] = count
+            if below:
+                pruned_below[relative_path] = below
+            return count
+        
+        return finish(base_relative_path)
+    
+    def add_written_file(self, scan: TreeScanResult, base_path: str, path: str):
+        """List a file written since scan_tree ran, or refresh its stat if already listed."""
+        path = os.path.abspath(path)
+        relative_path = os.path.relpath(os.path.dirname(path), base_path)
+        relative_path = '' if relative_path == '.' else relative_path.replace(os.sep, '/')
+        
+        # Directories that were not scanned will be read once they are needed
+        data = scan.structure.get(relative_path)
+        if data is None:
+            return
+        try:
+            file_stats = os.stat(path)
+        except OSError:
+            return
+        
+        name = os.path.basename(path)
+        files = data['files']
+        index = bisect.bisect_left([file_name for file_name, _ in files], name)
+        if index < len(files) and files[index][0] == name:
+            files[index] = (name, file_stats)
+            return
+        files.insert(index, (name, file_stats))
+        
+        # One more item in the directory and every ancestor
+        parent = relative_path
+        scan.item_counts[parent] += 1
+        while parent:
+            parent = parent.rpartition('/')[0]
+            scan.item_counts[parent] += 1
+    
+    def ask_user_preferences(self, scan: TreeScanResult):
         """Interactive prompt for user preferences."""
         print(f"\n{Fore.CYAN}=== Directory Mapper Configuration ==={Style.RESET_ALL}\n")
         
@@ -250,48 +722,60 @@ class DirectoryMapper:
             
             if use_saved:
                 # Check for new patterns
-                self.check_for_new_patterns()
+                self.check_for_new_patterns(scan)
                 return
         
         # Ask about common ignore patterns
         print(f"\n{Fore.YELLOW}Detected common ignore patterns in your project:{Style.RESET_ALL}")
         
-        # Handle directories
-        if self.detected_patterns['directories']:
-            print(f"\n{Fore.CYAN}Directories to potentially ignore:{Style.RESET_ALL}")
-            for dir_name in sorted(self.detected_patterns['directories']):
-                description = COMMON_IGNORE_PATTERNS['directories'][dir_name]
-                
-                # Check if it's a large directory
-                example_path = None
-                size_info = ""
-                for root, dirs, _ in os.walk(base_path):
-                    if dir_name in dirs:
-                        example_path = os.path.join(root, dir_name)
-                        count = self.count_directory_contents(example_path)
-                        if count > LARGE_DIR_THRESHOLD:
-                            size_info = f" {Fore.RED}(Contains ~{count} items!){Style.RESET_ALL}"
-                        break
-                
-                include = questionary.confirm(
-                    f"Include '{dir_name}' - {description}{size_info}?",
-                    default=False
-                ).ask()
-                
-                self.config.config['ignore_patterns']['directories'][dir_name] = not include
-        
-        # Handle files
-        if self.detected_patterns['files']:
-            print(f"\n{Fore.CYAN}File patterns to potentially ignore:{Style.RESET_ALL}")
-            for file_pattern in sorted(self.detected_patterns['files']):
-                description = COMMON_IGNORE_PATTERNS['files'][file_pattern]
-                
-                include = questionary.confirm(
-                    f"Include '{file_pattern}' - {description}?",
-                    default=False
-                ).ask()
-                
-                self.config.config['ignore_patterns']['files'][file_pattern] = not include
+        asked_dirs = set()
+        asked_files = set()
+        while True:
+            new_dirs = self.detected_patterns['directories'] - asked_dirs
+            new_files = self.detected_patterns['files'] - asked_files
+            if not new_dirs and not new_files:
+                break
+            asked_dirs |= new_dirs
+            asked_files |= new_files
+            
+            # Handle directories
+            if new_dirs:
+                print(f"\n{Fore.CYAN}Directories to potentially ignore:{Style.RESET_ALL}")
+                for dir_name in sorted(new_dirs):
+                    description = COMMON_IGNORE_PATTERNS['directories'][dir_name]
+                    
+                    # Check if it's a large directory
+                    size_info = ""
+                    example_path = scan.example_paths.get(dir_name)
+                    if example_path is not None:
+                        # Only whether it is large matters, so stop counting past the threshold
+                        if self.is_large_directory(example_path):
+                            size_info = f" {Fore.RED}(Contains more than {LARGE_DIR_THRESHOLD} items!){Style.RESET_ALL}"
+                    
+                    include = questionary.confirm(
+                        f"Include '{dir_name}' - {description}{size_info}?",
+                        default=False
+                    ).ask()
+                    
+                    self.config.set_ignore_pattern('directories', dir_name, not include)
+            
+            # Handle files
+            if new_files:
+                print(f"\n{Fore.CYAN}File patterns to potentially ignore:{Style.RESET_ALL}")
+                for file_pattern in sorted(new_files):
+                    description = COMMON_IGNORE_PATTERNS['files'][file_pattern]
+                    
+                    include = questionary.confirm(
+                        f"Include '{file_pattern}' - {description}?",
+                        default=False
+                    ).ask()
+                    
+                    self.config.set_ignore_pattern('files', file_pattern, not include)
+            
+            # Included directories were pruned from the scan; reading them
+            # now may turn up more patterns to ask about
+            self._should_ignore_item_cached.cache_clear()
+            self.expand_included_dirs(scan)
         
         # Ask about saving preferences
         save_config = questionary.confirm(
@@ -301,25 +785,42 @@ class DirectoryMapper:
         
         if save_config:
             self.config.save_config()
-    
-    def check_for_new_patterns(self):
-        """Check for new patterns that weren't in the saved configuration."""
-        new_dirs = set()
-        new_files = set()
-        
-        # Check for new directory patterns
-        for dir_name in self.detected_patterns['directories']:
-            if dir_name not in self.config.config['ignore_patterns']['directories']:
-                new_dirs.add(dir_name)
         
-        # Check for new file patterns
-        for file_pattern in self.detected_patterns['files']:
-            if file_pattern not in self.config.config['ignore_patterns']['files']:
-                new_files.add(file_pattern)
+        self._should_ignore_item_cached.cache_clear()
+    
+    def check_for_new_patterns(self, scan: Optional[TreeScanResult] = None):
+        """Check for new patterns that weren't in the saved configuration.
         
-        # Ask about new patterns
-        if new_dirs or new_files:
-            print(f"\n{Fore.YELLOW}New ignore patterns detected since last run:{Style.RESET_ALL}")
+        Given the scan, directories the saved configuration includes are read
+        first, and again after each round of answers, so patterns inside them
+        are asked about too.
+        """
+        asked = False
+        while True:
+            if scan is not None:
+                self._should_ignore_item_cached.cache_clear()
+                self.expand_included_dirs(scan)
+            
+            new_dirs = set()
+            new_files = set()
+            
+            # Check for new directory patterns
+            for dir_name in self.detected_patterns['directories']:
+                if dir_name not in self.config.config['ignore_patterns']['directories']:
+                    new_dirs.add(dir_name)
+            
+            # Check for new file patterns
+            for file_pattern in self.detected_patterns['files']:
+                if file_pattern not in self.config.config['ignore_patterns']['files']:
+                    new_files.add(file_pattern)
+            
+            if not new_dirs and not new_files:
+                break
+            
+            # Ask about new patterns
+            if not asked:
+                print(f"\n{Fore.YELLOW}New ignore patterns detected since last run:{Style.RESET_ALL}")
+            asked = True
             
             if new_dirs:
                 print(f"\n{Fore.CYAN}New directories:{Style.RESET_ALL}")
@@ -329,7 +830,7 @@ class DirectoryMapper:
                         f"Include '{dir_name}' - {description}?",
                         default=False
                     ).ask()
-                    self.config.config['ignore_patterns']['directories'][dir_name] = not include
+                    self.config.set_ignore_pattern('directories', dir_name, not include)
             
             if new_files:
                 print(f"\n{Fore.CYAN}New file patterns:{Style.RESET_ALL}")
@@ -339,13 +840,20 @@ class DirectoryMapper:
                         f"Include '{file_pattern}' - {description}?",
                         default=False
                     ).ask()
-                    self.config.config['ignore_patterns']['files'][file_pattern] = not include
-            
-            # Save updated configuration
+                    self.config.set_ignore_pattern('files', file_pattern, not include)
+        
+        # Save updated configuration
+        if asked:
             self.config.save_config()
+        
+        self._should_ignore_item_cached.cache_clear()
     
     def should_ignore_item(self, name: str, is_dir: bool, path: str = None) -> bool:
         """Determine if an item should be ignored."""
+        return self._should_ignore_item_cached(name, is_dir)
+    
+    def _match_ignore_item(self, name: str, is_dir: bool) -> bool:
+        """Uncached decision behind should_ignore_item."""
         # Always ignore the script itself and output file
         if name == self.current_script or name == self.output_file:
             return True
@@ -355,14 +863,6 @@ class DirectoryMapper:
         if ignore_config is not None:
             return ignore_config
         
-        # Check file patterns
-        if not is_dir:
-            for pattern, should_ignore in self.config.config['ignore_patterns']['files'].items():
-                if '*' in pattern:
-                    import fnmatch
-                    if fnmatch.fnmatch(name, pattern) and should_ignore:
-                        return True
-        
         return False
     
     def format_size(self, size: int) -> str:
@@ -375,109 +875,33 @@ class DirectoryMapper:
     
     def get_file_icon(self, filename: str) -> str:
         """Get an appropriate icon for the file based on its extension."""
-        icon_mapping = {
-            '.py': '🐍',    # Python
-            '.js': '📜',    # JavaScript
-            '.html': '🌐',  # HTML
-            '.css': '🎨',   # CSS
-            '.json': '📋',  # JSON
-            '.md': '📝',    # Markdown
-            '.txt': '📄',   # Text
-            '.pdf': '📑',   # PDF
-            '.jpg': '🖼️',   # Image
-            '.jpeg': '🖼️',  # Image
-            '.png': '🖼️',   # Image
-            '.gif': '🖼️',   # Image
-            '.svg': '🖼️',   # Image
-            '.mp3': '🎵',   # Audio
-            '.mp4': '🎬',   # Video
-            '.zip': '📦',   # Archive
-            '.tar': '📦',   # Archive
-            '.gz': '📦',    # Archive
-            '.rar': '📦',   # Archive
-            '.7z': '📦',    # Archive
-            '.doc': '📃',   # Document
-            '.docx': '📃',  # Document
-            '.xls': '📊',   # Spreadsheet
-            '.xlsx': '📊',  # Spreadsheet
-            '.ppt': '📽️',   # Presentation
-            '.pptx': '📽️',  # Presentation
-            '.sh': '⚙️',    # Shell script
-            '.bat': '⚙️',   # Batch script
-            '.exe': '⚙️',   # Executable
-            '.dll': '🔌',   # Library
-            '.so': '🔌',    # Library
-            '.h': '📚',     # Header
-            '.c': '📚',     # C source
-            '.cpp': '📚',   # C++ source
-            '.java': '☕',  # Java
-            '.class': '☕', # Java class
-            '.rb': '💎',    # Ruby
-            '.php': '🐘',   # PHP
-            '.sql': '🗄️',   # SQL
-            '.db': '🗄️',    # Database
-            '.xml': '📰',   # XML
-            '.yml': '📰',   # YAML
-            '.yaml': '📰',  # YAML
-            '.toml': '📰',  # TOML
-            '.ini': '⚙️',   # INI configuration
-            '.cfg': '⚙️',   # Configuration
-            '.conf': '⚙️',  # Configuration
-            '.log': '📜',   # Log
-        }
-        
         extension = os.path.splitext(filename)[1].lower()
-        return icon_mapping.get(extension, '📄')  # Default to generic file icon
+        return _ICON_MAPPING.get(extension, '📄')  # Default to generic file icon
     
-    def generate_directory_tree(self, start_path: str) -> List[str]:
-        """Generate a nicely formatted directory tree."""
-        lines = []
+    def stream_tree(self, start_path: str, scan: TreeScanResult) -> Iterator[str]:
+        """Yield the lines of a nicely formatted directory tree from a completed scan.
+        
+        Each directory's entry is dropped from scan.structure once it has been
+        emitted, so the scan cannot be streamed twice.
+        """
         start_path = os.path.abspath(start_path)
         root_name = os.path.basename(start_path)
         
         # Start with the root directory
-        lines.append(f"📁 **{root_name}/**")
-        
-        # Store directory structure
-        structure = {}
-        
-        # First pass: collect structure
-        for root, dirs, files in os.walk(start_path):
-            # Calculate relative path
-            relative_path = os.path.relpath(root, start_path)
-            if relative_path == '.':
-                relative_path = ''
-            
-            # Filter directories
-            filtered_dirs = []
-            for d in dirs[:]:  # Use slice to allow modification during iteration
-                if self.should_ignore_item(d, True, os.path.join(root, d)):
-                    dirs.remove(d)  # Prevent os.walk from descending
-                else:
-                    filtered_dirs.append(d)
-            
-            # Filter files
-            filtered_files = [
-                f for f in files 
-                if not self.should_ignore_item(f, False, os.path.join(root, f))
-            ]
-            
-            # Store structure
-            structure[relative_path] = {
-                'dirs': sorted(filtered_dirs),
-                'files': sorted(filtered_files)
-            }
+        yield f"📁 **{root_name}/**"
         
         # Function to recursively print the tree
         def print_tree(path: str, prefix: str = ""):
-            data = structure.get(path, {'dirs': [], 'files': []})
-            dirs = data['dirs']
-            files = data['files']
+            data = scan.structure.pop(path, {'dirs': [], 'files': []})
+            
+            # Filter items; ignored directories are never descended into
+            dirs = [d for d in data['dirs'] if not self.should_ignore_item(d, True)]
+            files = [f for f in data['files'] if not self.should_ignore_item(f[0], False)]
             
             # Process all items (dirs first, then files)
-            all_items = [(d, True) for d in dirs] + [(f, False) for f in files]
+            all_items = [(d, True, None) for d in dirs] + [(f, False, st) for f, st in files]
             
-            for i, (name, is_dir) in enumerate(all_items):
+            for i, (name, is_dir, stats) in enumerate(all_items):
                 is_last = (i == len(all_items) - 1)
                 
                 # Determine the connector
@@ -488,28 +912,31 @@ class DirectoryMapper:
                     connector = "├── "
                     next_prefix = prefix + "│   "
                 
-                # Create the full path
-                full_path = os.path.join(start_path, path, name)
+                # Create the relative path
+                item_path = path + '/' + name if path else name
                 
                 # Add the item
                 if is_dir:
                     # Check if it's a large directory
-                    item_count = self.count_directory_contents(full_path)
+                    self.ensure_scanned(scan, item_path)
+                    if item_path in scan.links:
+                        # Counted through the link, as os.walk on it would
+                        item_count = self.count_directory_contents(scan.links[item_path])
+                    else:
+                        item_count = self.full_item_count(scan, item_path)
                     size_indicator = ""
                     if item_count > LARGE_DIR_THRESHOLD:
                         size_indicator = f" {Fore.YELLOW}({item_count} items){Style.RESET_ALL}"
                     
-                    lines.append(f"{prefix}{connector}📁 **{name}/**{size_indicator}")
+                    yield f"{prefix}{connector}📁 **{name}/**{size_indicator}"
                     
                     # Recursively process
-                    new_path = os.path.join(path, name) if path else name
-                    print_tree(new_path, next_prefix)
+                    yield from print_tree(item_path, next_prefix)
                 else:
                     # Get file information
-                    try:
-                        stats = os.stat(full_path)
+                    if stats is not None:
                         size = self.format_size(stats.st_size)
-                        modified = datetime.datetime.fromtimestamp(stats.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+                        modified = _strftime(_TIMESTAMP_FORMAT, _localtime(stats.st_mtime))
                         
                         # Format filename
                         name_without_ext, ext = os.path.splitext(name)
@@ -521,53 +948,61 @@ class DirectoryMapper:
                         # Get icon
                         icon = self.get_file_icon(name)
                         
-                        lines.append(f"{prefix}{connector}{icon} {formatted_name} ({size}, {modified})")
-                    except (FileNotFoundError, PermissionError):
-                        lines.append(f"{prefix}{connector}📄 {name} (unavailable)")
+                        yield f"{prefix}{connector}{icon} {formatted_name} ({size}, {modified})"
+                    else:
+                        yield f"{prefix}{connector}📄 {name} (unavailable)"
         
         # Start recursive printing
-        print_tree('')
-        
-        return lines
-    
-    def generate_statistics(self, base_path: str) -> Dict:
-        """Generate statistics about the directory."""
-        stats = {
-            'file_count': 0,
-            'dir_count': 0,
-            'total_size': 0,
-            'ignored_items': 0,
-            'file_types': {}
-        }
+        yield from print_tree('')
+    
+    def generate_statistics(self, scan: TreeScanResult) -> Dict:
+        """Generate statistics about the directory from a completed scan."""
+        file_count = 0
+        dir_count = 0
+        total_size = 0
+        ignored_items = 0
+        file_types = {}
+        should_ignore_item = self.should_ignore_item
+        splitext = os.path.splitext
         
-        for root, dirs, files in os.walk(base_path):
-            # Count directories
-            for d in dirs[:]:
-                if self.should_ignore_item(d, True, os.path.join(root, d)):
-                    dirs.remove(d)
-                    stats['ignored_items'] += 1
-                else:
-                    stats['dir_count'] += 1
+        pending = ['']
+        while pending:
+            path = pending.pop()
+            data = scan.structure.get(path, {'dirs': [], 'files': []})
             
             # Count files
-            for f in files:
-                if self.should_ignore_item(f, False, os.path.join(root, f)):
-                    stats['ignored_items'] += 1
+            for f, file_stats in data['files']:
+                if should_ignore_item(f, False):
+                    ignored_items += 1
+                    continue
+                file_count += 1
+                
+                # File size, from the stat taken during the scan
+                if file_stats is not None:
+                    total_size += file_stats.st_size
+                
+                # File types
+                ext = splitext(f)[1].lower()
+                if ext:
+                    file_types[ext] = file_types.get(ext, 0) + 1
+            
+            # Count directories
+            for d in data['dirs']:
+                if should_ignore_item(d, True):
+                    ignored_items += 1
                 else:
-                    stats['file_count'] += 1
-                    
-                    # File size
-                    try:
-                        stats['total_size'] += os.path.getsize(os.path.join(root, f))
-                    except (FileNotFoundError, PermissionError):
-                        pass
-                    
-                    # File types
-                    ext = os.path.splitext(f)[1].lower()
-                    if ext:
-                        stats['file_types'][ext] = stats['file_types'].get(ext, 0) + 1
+                    dir_count += 1
+                    dir_path = path + '/' + d if path else d
+                    self.ensure_scanned(scan, dir_path)
+                    pending.append(dir_path)
         
-        return stats
+        return {
+            'file_count': file_count,
+            'dir_count': dir_count,
+            'total_size': total_size,
+            'ignored_items': ignored_items,
+            'file_types': file_types
+        }
     
     def generate_directory_markdown(self):
         """Generate a markdown file with the directory structure."""
@@ -576,80 +1011,55 @@ class DirectoryMapper:
         
         print(f"\n{Fore.CYAN}Scanning directory structure...{Style.RESET_ALL}")
         
-        # Detect patterns first
-        self.detect_ignore_patterns(current_dir)
+        # Walk the tree once; detected patterns are needed before asking
+        scan = self.scan_tree(current_dir)
+        self.detected_patterns = scan.detected
         
         # Ask user preferences
-        self.ask_user_preferences(current_dir)
+        self.ask_user_preferences(scan)
+        
+        # The scan predates any config file just saved; list it as it stands now
+        self.add_written_file(scan, current_dir, self.config.config_file)
         
         print(f"\n{Fore.CYAN}Generating directory tree...{Style.RESET_ALL}")
         
         # Generate content
-        content = f"# Project Directory: {parent_dir_name}\n\n"
-        content += f"Directory structure generated on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        parts = [f"# Project Directory: {parent_dir_name}\n\n"]
+        parts.append(f"Directory structure generated on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
         
         # Add statistics
-        stats = self.generate_statistics(current_dir)
-        content += f"* Total files: {stats['file_count']}\n"
-        content += f"* Total directories: {stats['dir_count']}\n"
-        content += f"* Total size: {self.format_size(stats['total_size'])}\n"
+        stats = self.generate_statistics(scan)
+        parts.append(f"* Total files: {stats['file_count']}\n")
+        parts.append(f"* Total directories: {stats['dir_count']}\n")
+        parts.append(f"* Total size: {self.format_size(stats['total_size'])}\n")
         if stats['ignored_items'] > 0:
-            content += f"* Ignored items: {stats['ignored_items']}\n"
-        content += "\n"
+            parts.append(f"* Ignored items: {stats['ignored_items']}\n")
+        parts.append("\n")
         
-        # Add tree structure
-        content += "```\n"
-        tree = self.generate_directory_tree(current_dir)
-        content += "\n".join(tree)
-        content += "\n```\n\n"
+        # Tree structure is streamed between the header and the summary
+        parts.append("```\n")
+        footer = ["```\n\n"]
         
         # Add file type summary
         if stats['file_types']:
-            content += "## File Type Summary\n\n"
+            footer.append("## File Type Summary\n\n")
             sorted_types = sorted(stats['file_types'].items(), key=lambda x: x[1], reverse=True)
             for ext, count in sorted_types[:10]:  # Top 10 file types
-                content += f"* `{ext}`: {count} files\n"
+                footer.append(f"* `{ext}`: {count} files\n")
             if len(sorted_types) > 10:
-                content += f"* ... and {len(sorted_types) - 10} more file types\n"
-            content += "\n"
+                footer.append(f"* ... and {len(sorted_types) - 10} more file types\n")
+            footer.append("\n")
         
         # Add icon legend
-        content += "## Icon Legend\n\n"
-        content += "📁 - Directory\n"
-        
-        # Group icons by type
-        icon_groups = {}
-        icon_mapping = {
-            '.py': '🐍', '.js': '📜', '.html': '🌐', '.css': '🎨',
-            '.json': '📋', '.md': '📝', '.txt': '📄', '.pdf': '📑',
-            '.jpg': '🖼️', '.jpeg': '🖼️', '.png': '🖼️', '.gif': '🖼️',
-            '.svg': '🖼️', '.mp3': '🎵', '.mp4': '🎬', '.zip': '📦',
-            '.tar': '📦', '.gz': '📦', '.rar': '📦', '.7z': '📦',
-            '.doc': '📃', '.docx': '📃', '.xls': '📊', '.xlsx': '📊',
-            '.ppt': '📽️', '.pptx': '📽️', '.sh': '⚙️', '.bat': '⚙️',
-            '.exe': '⚙️', '.dll': '🔌', '.so': '🔌', '.h': '📚',
-            '.c': '📚', '.cpp': '📚', '.java': '☕', '.class': '☕',
-            '.rb': '💎', '.php': '🐘', '.sql': '🗄️', '.db': '🗄️',
-            '.xml': '📰', '.yml': '📰', '.yaml': '📰', '.toml': '📰',
-            '.ini': '⚙️', '.cfg': '⚙️', '.conf': '⚙️', '.log': '📜',
-        }
-        
-        for ext, icon in icon_mapping.items():
-            if icon not in icon_groups:
-                icon_groups[icon] = []
-            icon_groups[icon].append(ext)
-        
-        for icon, extensions in sorted(icon_groups.items()):
-            exts = sorted(extensions)
-            if len(exts) > 5:
-                ext_display = ", ".join(exts[:5]) + ", etc."
-            else:
-                ext_display = ", ".join(exts)
-            content += f"{icon} - {ext_display}\n"
+        footer.append(_ICON_LEGEND)
         
         # Write the file
         with open(self.output_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+            f.writelines(parts)
+            for line in self.stream_tree(current_dir, scan):
+                f.write(line)
+                f.write("\n")
+            f.writelines(footer)
         
         print(f"\n{Fore.GREEN}✓ Directory structure has been written to {self.output_file}{Style.RESET_ALL}")
         
@@ -663,8 +1073,7 @@ class DirectoryMapper:
 def main():
     """Main function to run the script."""
     try:
-        # Check and install dependencies
-        check_and_install_dependencies()
+        colorama.init()
         
         # Initialize configuration
         config = DirectoryMapperConfig()